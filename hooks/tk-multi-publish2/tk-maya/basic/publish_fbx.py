@@ -11,6 +11,12 @@ from tank_vendor import six
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+# Maya file types keyed by their lowercase file extension.
+_MAYA_EXT_TYPES = {
+    ".ma": "mayaAscii",
+    ".mb": "mayaBinary",
+}
+
 
 class MayaFBXPublishPlugin(HookBaseClass):
     """
@@ -380,11 +386,7 @@ def _save_session(path):
 
     # Maya can choose the wrong file type so we should set it here
     # explicitly based on the extension
-    maya_file_type = None
-    if path.lower().endswith(".ma"):
-        maya_file_type = "mayaAscii"
-    elif path.lower().endswith(".mb"):
-        maya_file_type = "mayaBinary"
+    maya_file_type = _MAYA_EXT_TYPES.get(os.path.splitext(path)[1].lower())
 
     # Maya won't ensure that the folder is created when saving, so we must make sure it exists
     folder = os.path.dirname(path)
@@ -3,27 +3,111 @@
 # file included in this repository.
 
 import sgtk
-from tank_vendor import six
 from sgtk.platform.qt import QtGui, QtCore
-from pathlib import Path
 
-import maya.cmds as cmds
-import maya.mel as mel
-
-import copy
-import datetime
+# Note: modules only needed when validating and publishing, e.g. maya.cmds or
+# subprocess, are imported where they are used, so loading this hook just to
+# display its UI stays cheap.
+import functools
 import logging
 import os
-import pprint
 import re
-import shutil
-import subprocess
 import sys
-import tempfile
-from six.moves.urllib import parse
+import time
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+# Maximum number of matching paths listed in a BrowsablePathWidget.
+_MAX_PATH_ITEMS = 200
+
+# Number of seconds detected Unreal versions are cached for.
+_UNREAL_VERSIONS_CACHE_TTL = 30
+
+# Number of seconds to wait for Unreal output before processing Qt events.
+_UNREAL_POLL_INTERVAL = 0.1
+# Maximum number of seconds to wait for remaining output once Unreal exited.
+# Processes started by Unreal can keep its output pipe open after it exited.
+_UNREAL_OUTPUT_DRAIN_TIMEOUT = 1.0
+
+# Non-word characters, which Unreal doesn't like in file names.
+_NON_WORD_RE = re.compile(r"\W", re.UNICODE)
+# Avi movie file extension.
+_AVI_SUFFIX_RE = re.compile(r"\.avi$")
+# Bad Windows paths with a leading slash before the drive letter.
+_WIN_DRIVE_PREFIX_RE = re.compile(r"^/[A-Za-z]:/")
+# Keys replaced in Unreal project path templates.
+_PROJECT_PATH_KEY_RE = re.compile(r"\{(config|engine|unreal_engine_version|self)\}")
+
+# Maya file types keyed by their lowercase file extension.
+_MAYA_EXT_TYPES = {
+    ".ma": "mayaAscii",
+    ".mb": "mayaBinary",
+}
+
+# Unreal project folders which are not modified in place when rendering the
+# turntable and can be hard linked to the original files. Other folders and
+# files, e.g. the .uproject file or the Config folder, are copied.
+_UNREAL_PROJECT_LINKED_FOLDERS = ("Content", "Plugins", "DerivedDataCache")
+# Unreal project folders written to by Unreal, e.g. caches, logs and the
+# Movie Render Queue manifest, which are left out of project copies.
+_UNREAL_PROJECT_SKIPPED_FOLDERS = ("Intermediate", "Saved")
+# Extensions of files in linked folders which can be modified when setting up
+# the turntable and must be copied instead of being linked.
+_UNREAL_PROJECT_COPIED_EXTENSIONS = (".umap",)
+
+# Console variables set when rendering with the Movie Render Queue.
+# TODO: check what these settings are
+_MRQ_DPCVARS = ",".join((
+    "sg.ViewDistanceQuality=4",
+    "sg.AntiAliasingQuality=4",
+    "sg.ShadowQuality=4",
+    "sg.PostProcessQuality=4",
+    "sg.TextureQuality=4",
+    "sg.EffectsQuality=4",
+    "sg.FoliageQuality=4",
+    "sg.ShadingQuality=4",
+    "r.TextureStreaming=0",
+    "r.ForceLOD=0",
+    "r.SkeletalMeshLODBias=-10",
+    "r.ParticleLODBias=-10",
+    "foliage.DitheredLOD=0",
+    "foliage.ForceLOD=0",
+    "r.Shadow.DistanceScale=10",
+    "r.ShadowQuality=5",
+    "r.Shadow.RadiusThreshold=0.001000",
+    "r.ViewDistanceScale=50",
+    "r.D3D12.GPUTimeout=0",
+    "a.URO.Enable=0",
+))
+# Command line arguments used for all Movie Render Queue renders.
+_MRQ_STATIC_ARGS = (
+    "MoviePipelineEntryMap?game=/Script/MovieRenderPipelineCore.MoviePipelineGameMode",
+    "-game",
+    "-Multiprocess",
+    "-NoLoadingScreen",
+    "-FixedSeed",
+    "-log",
+    "-Unattended",
+    "-messaging",
+    "-SessionName=Maya Turntable Movie Render",
+    "-nohmd",
+    "-windowed",
+    "-ResX=1280",
+    "-ResY=720",
+    "-dpcvars=%s" % _MRQ_DPCVARS,
+    "-execcmds=r.HLOD 0",
+)
+
+# Paths found on disk, as (check function, path) tuples.
+_found_paths = set()
+
+# Engine and the save as log action built for it by _get_save_as_action.
+_save_as_action_cache = (None, None)
+
+# QIcons shared by all widgets, keyed by their Qt resource path. They are
+# created on first use, when a QApplication is available.
+_QT_ICONS = {}
+
 
 class BrowsablePathWidget(QtGui.QFrame):
     """
@@ -46,27 +130,18 @@ class BrowsablePathWidget(QtGui.QFrame):
         )
 
         self.open_button = QtGui.QToolButton()
-        icon = QtGui.QIcon()
-        icon.addPixmap(
-            QtGui.QPixmap(":/tk_multi_publish2/file.png"),
-            QtGui.QIcon.Normal,
-            QtGui.QIcon.Off
-        )
-        self.open_button.setIcon(icon)
+        self.open_button.setIcon(_get_qt_icon(":/tk_multi_publish2/file.png"))
         self.open_button.clicked.connect(self._open_current_path)
+        # The path is empty, so nothing can be opened yet.
+        self._open_enabled = False
+        self.open_button.setEnabled(False)
         self.combo_box.editTextChanged.connect(self._enable_open_button)
         if not with_open_button:
             # Hide the button if not needed.
             self.open_button.hide()
 
         self.browse_button = QtGui.QToolButton()
-        icon = QtGui.QIcon()
-        icon.addPixmap(
-            QtGui.QPixmap(":/tk_multi_publish2/browse_white.png"),
-            QtGui.QIcon.Normal,
-            QtGui.QIcon.Off
-        )
-        self.browse_button.setIcon(icon)
+        self.browse_button.setIcon(_get_qt_icon(":/tk_multi_publish2/browse_white.png"))
         self.browse_button.clicked.connect(self._browse)
 
         layout = QtGui.QHBoxLayout()
@@ -75,6 +150,10 @@ class BrowsablePathWidget(QtGui.QFrame):
         layout.addWidget(self.open_button)
         layout.addWidget(self.browse_button)
         self.setLayout(layout)
+        # The Toolkit API instance is cached and only retrieved again if the
+        # current Engine changes.
+        self._cached_engine = None
+        self._cached_sgtk = None
 
     @property
     def sgtk(self):
@@ -83,17 +162,18 @@ class BrowsablePathWidget(QtGui.QFrame):
                   ``None``.
         """
         current_engine = sgtk.platform.current_engine()
-        if not current_engine:
-            return None
-        return current_engine.sgtk
+        if current_engine is not self._cached_engine:
+            self._cached_engine = current_engine
+            self._cached_sgtk = current_engine.sgtk if current_engine else None
+        return self._cached_sgtk
 
     def get_path(self):
         """
         Return the current path value.
 
-        :returns: An utf-8 encoded string.
+        :returns: A string.
         """
-        return six.ensure_str(self.combo_box.currentText())
+        return self.combo_box.currentText()
 
     def set_path(self, path):
         """
@@ -104,29 +184,65 @@ class BrowsablePathWidget(QtGui.QFrame):
         # TODO: this was copied over from another tool where users could enter
         # a path and similar paths were added from matching TK templates. If not
         # needeed, let's remove it.
-        self.combo_box.model().clear()
+        if (
+            path
+            and path == self.combo_box.lineEdit().text()
+            and self.combo_box.count() > 0
+        ):
+            # Nothing to do, matching paths were already retrieved for this path.
+            return
+        other_paths = []
         if path:
-            templates = self.sgtk.templates_from_path(path)
-            other_paths = []
-            for template in templates:
+            tk = self.sgtk
+            for template_name in _templates_from_path(tk, path):
+                template = tk.templates[template_name]
                 fields = template.validate_and_get_fields(path, skip_keys=["version"])
                 if fields:
                     other_paths.extend(
-                        self.sgtk.paths_from_template(
-                            template,
-                            fields,
+                        _paths_from_template(
+                            tk,
+                            template_name,
+                            tuple(sorted(fields.items())),
                         )
                     )
-            if other_paths:
-                self.combo_box.addItems(sorted(other_paths, reverse=True))
+        # Populate a new model and swap it in a single pass instead of adding
+        # items one by one, which triggers view and layout updates per item.
+        other_paths = sorted(other_paths, reverse=True)[:_MAX_PATH_ITEMS]
+        model = QtGui.QStandardItemModel(len(other_paths), 1, self.combo_box)
+        for i, other_path in enumerate(other_paths):
+            model.setItem(i, 0, QtGui.QStandardItem(other_path))
+        # Signals are blocked so the intermediate selection of the first item
+        # does not update the edit text and the size hint, which only happens
+        # once when the value is set below. The AdjustToMinimumContentsLength
+        # size policy is kept so long paths do not resize the combo box.
+        self.combo_box.setUpdatesEnabled(False)
+        self.combo_box.blockSignals(True)
+        try:
+            # The previous model is deleted by the combo box, its parent.
+            self.combo_box.setModel(model)
+        finally:
+            self.combo_box.blockSignals(False)
+            self.combo_box.setUpdatesEnabled(True)
         # Set the value last to not lose it when setting the combo box items
         self.combo_box.lineEdit().setText(path)
+        # The edit text can already be set to the path from the model first
+        # item while signals were blocked, and then setText does not emit any
+        # change, so the open button must be updated explicitly.
+        self._enable_open_button(path)
+        self.combo_box.updateGeometry()
 
     def _enable_open_button(self, path):
         """
         Enable the open button if a path is set, disable it otherwise.
+
+        The button is only updated when its state actually changes, this is
+        called for every edit of the path.
         """
-        self.open_button.setEnabled(bool(path))
+        enabled = bool(path)
+        if enabled == self._open_enabled:
+            return
+        self._open_enabled = enabled
+        self.open_button.setEnabled(enabled)
 
     def _open_current_path(self):
         """
@@ -144,11 +260,16 @@ class BrowsablePathWidget(QtGui.QFrame):
         # desktop services, which could lead to our current scene being replaced
         # when dealing with Maya files. We use `open -n` to force new instances
         # of the application to be used.
+        # Applications are started without a shell and without waiting for them.
         if sys.platform == "darwin":
-            os.system("open -n %s" % current_path)
+            import subprocess
+
+            subprocess.Popen(["open", "-n", current_path])
+        elif sys.platform == "win32":
+            os.startfile(current_path)
         else:
             QtGui.QDesktopServices.openUrl(
-                QtCore.QUrl("file:///%s" % current_path, QtCore.QUrl.TolerantMode)
+                QtCore.QUrl.fromLocalFile(current_path)
             )
 
     def _browse(self, folders=False):
@@ -164,9 +285,12 @@ class BrowsablePathWidget(QtGui.QFrame):
         current_path = self.get_path()
 
         # Options for either browse type
+        # Custom directory icons are not used to avoid looking up each entry
+        # in the current directory, which can be very slow on network drives.
         options = [
             QtGui.QFileDialog.DontResolveSymlinks,
-            QtGui.QFileDialog.DontUseNativeDialog
+            QtGui.QFileDialog.DontUseNativeDialog,
+            QtGui.QFileDialog.DontUseCustomDirectoryIcons,
         ]
 
         if folders:
@@ -213,6 +337,8 @@ class UnrealSetupWidget(QtGui.QFrame):
         super(UnrealSetupWidget, self).__init__(*args, **kwargs)
         self._hook = hook
         self._unreal_project_path_template = None
+        # Evaluated project paths, keyed by (template, Unreal version)
+        self._project_path_cache = {}
         self.unreal_engine_label = QtGui.QLabel("Unreal Engine:")
         # A ComboBox for detected Unreal versions
         self.unreal_engine_versions_widget = QtGui.QComboBox()
@@ -237,6 +363,10 @@ class UnrealSetupWidget(QtGui.QFrame):
         settings_layout.addWidget(self.unreal_project_label)
         settings_layout.addWidget(self.unreal_project_widget)
         self.setLayout(settings_layout)
+        # The Toolkit API instance is cached and only retrieved again if the
+        # current Engine changes.
+        self._cached_engine = None
+        self._cached_sgtk = None
 
     @property
     def sgtk(self):
@@ -245,9 +375,10 @@ class UnrealSetupWidget(QtGui.QFrame):
                   ``None``.
         """
         current_engine = sgtk.platform.current_engine()
-        if not current_engine:
-            return None
-        return current_engine.sgtk
+        if current_engine is not self._cached_engine:
+            self._cached_engine = current_engine
+            self._cached_sgtk = current_engine.sgtk if current_engine else None
+        return self._cached_sgtk
 
     def populate_unreal_versions(self, unreal_versions, current_version):
         """
@@ -259,19 +390,30 @@ class UnrealSetupWidget(QtGui.QFrame):
         :param unreal_versions: A list of :class:`SoftwareVersion` instances.
         :param current_version: An Unreal version number, as a string.
         """
-        # See if we can match with just a major.minor
-        short_current_version = _short_version(current_version)
-        for i, unreal_version in enumerate(unreal_versions):
-            self.unreal_engine_versions_widget.addItem(
-                unreal_version.display_name,
-                userData=unreal_version,
-            )
-            short_version = _short_version(unreal_version.version)
-            if short_version == short_current_version:
-                self.unreal_engine_versions_widget.setCurrentIndex(
-                    i,
+        # See if we can match with just a major.minor, the last matching
+        # version is selected.
+        short_version_indexes = {
+            _short_version(unreal_version.version): i
+            for i, unreal_version in enumerate(unreal_versions)
+        }
+        current_index = short_version_indexes.get(
+            _short_version(current_version), -1
+        )
+        combo_box = self.unreal_engine_versions_widget
+        # Block signals while populating the combo box, the selection handler
+        # is called only once when done.
+        combo_box.blockSignals(True)
+        try:
+            for unreal_version in unreal_versions:
+                combo_box.addItem(
+                    unreal_version.display_name,
+                    userData=unreal_version,
                 )
-        sel = self.unreal_engine_versions_widget.currentIndex()
+            if current_index != -1:
+                combo_box.setCurrentIndex(current_index)
+        finally:
+            combo_box.blockSignals(False)
+        sel = combo_box.currentIndex()
         if sel != -1:
             self._current_unreal_version_changed(sel)
 
@@ -282,13 +424,36 @@ class UnrealSetupWidget(QtGui.QFrame):
 
         :param str project_path_template: A template string.
         """
+        if project_path_template != self._unreal_project_path_template:
+            self._project_path_cache.clear()
         self._unreal_project_path_template = project_path_template
-        project_path = self._hook.evaluate_unreal_project_path(
+        project_path = self._evaluate_project_path(
             project_path_template,
             self.unreal_version,
-        ) or ""
+        )
         self.unreal_project_widget.set_path(project_path)
 
+    def _evaluate_project_path(self, project_path_template, unreal_version):
+        """
+        Return the Unreal project path for the given template and Unreal version.
+
+        Evaluated paths are cached to not evaluate them again when switching
+        between Unreal versions.
+
+        :param str project_path_template: A template string.
+        :param str unreal_version: An Unreal version number, as a string.
+        :returns: A path, as a string, which can be empty.
+        """
+        key = (project_path_template, unreal_version)
+        project_path = self._project_path_cache.get(key)
+        if project_path is None:
+            project_path = self._hook.evaluate_unreal_project_path(
+                project_path_template,
+                unreal_version,
+            ) or ""
+            self._project_path_cache[key] = project_path
+        return project_path
+
     def _current_unreal_version_changed(self, index):
         """
         Called when the Unreal version is changed in the list of versions.
@@ -298,10 +463,10 @@ class UnrealSetupWidget(QtGui.QFrame):
         self.unreal_engine_widget.combo_box.lineEdit().setText(
             self.unreal_engine_versions_widget.itemData(index).path
         )
-        project_path = self._hook.evaluate_unreal_project_path(
+        project_path = self._evaluate_project_path(
             self._unreal_project_path_template,
             self.unreal_version,
-        ) or ""
+        )
         self.unreal_project_widget.set_path(project_path)
 
     @property
@@ -359,6 +524,99 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         ("Turntable Assets Path", "publish2.turntable.assets_path"),
     )
 
+    # List of settings which must be set, with the item property they are
+    # stored in and the message to log if not set.
+    _required_settings = (
+        ("Turntable Map Path", "turntable_map_path", "No Unreal turntable map configured."),
+        ("Sequence Path", "sequence_path", "No Unreal turntable sequence configured."),
+        ("Turntable Assets Path", "turntable_assets_path", "No Unreal turntable assets path configured."),
+    )
+
+    # Settings specific to this class
+    _turntable_settings = {
+        "Publish Template": {
+            "type": "template",
+            "default": None,
+            "description": "Template path for published work files. Should"
+                           "correspond to a template defined in "
+                           "templates.yml.",
+        },
+        "Work Template": {
+            "type": "template",
+            "default": None,
+            "description": "Template path for exported FBX files. Should"
+                           "correspond to a template defined in "
+                           "templates.yml.",
+        },
+        "Unreal Engine Version": {
+            "type": "string",
+            "default": "4.26",
+            "description": "Version of the Unreal Engine executable to use."
+        },
+        "Unreal Engine Path": {
+            "type": "string",
+            "default": None,
+            "description": "Full path the Unreal Engine executable to use."
+        },
+        # TODO: check if this should actually be a TK template.
+        "Unreal Project Path Template": {
+            "type": "string",
+            "default": "{config}/tk-multi-publish2/tk-maya/unreal/resources/{unreal_engine_version}/turntable/turntable.uproject",
+            "description": "Path template to the Unreal project to load."
+                           "{config}, {engine}, {unreal_engine_version} keys "
+                           "can be used and are replaced with runtime values."
+        },
+        "Unreal Project Path": {
+            "type": "string",
+            "default": None,
+            "description": "Path to the Unreal project to load."
+        },
+        "Turntable Map Path": {
+            "type": "string",
+            "default": "/Game/turntable/level/turntable.umap",
+            "description": "Unreal path to the turntable map to use to render the turntable."
+        },
+        "Sequence Path": {
+            "type": "string",
+            "default": "/Game/turntable/sequence/turntable_sequence.turntable_sequence",
+            "description": "Unreal path to the level sequence to use to render the turntable."
+        },
+        "Turntable Assets Path": {
+            "type": "string",
+            "default": "/Game/maya_turntable_assets",
+            "description": "Unreal output path where the turntable assets will be imported."
+        },
+        "Copy Project To Temp": {
+            "type": "bool",
+            "default": True,
+            "description": "Render the turntable from a temporary copy of the "
+                           "Unreal project. This should be left enabled if the "
+                           "project is shared with other users or is not "
+                           "writable, the project is otherwise used directly."
+        },
+    }
+
+    def __init__(self, *args, **kwargs):
+        """
+        Instantiate a new :class:`MayaUnrealTurntablePublishPlugin`.
+        """
+        super(MayaUnrealTurntablePublishPlugin, self).__init__(*args, **kwargs)
+        # Settings dictionary, built on first access.
+        self._settings_cache = None
+        # User settings manager, instantiated on first access.
+        self._settings_manager = None
+        # Detected Unreal versions and the time they were retrieved at.
+        self._unreal_versions_cache = None
+        self._unreal_versions_cache_time = None
+        # Detected Unreal versions keyed by their short major.minor version.
+        self._unreal_versions_by_short_version = {}
+        # Current engine and Unreal Qt framework, retrieved on first access.
+        self._engine_cache = None
+        self._unrealqt_fw_cache = None
+        # Unreal project path template values which don't depend on the
+        # Unreal version, built on first access.
+        self._project_path_values = None
+
     @property
     def description(self):
         """
@@ -406,70 +664,19 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
 
         The type string should be one of the data types that toolkit accepts as
         part of its environment configuration.
-        """
 
-        # inherit the settings from the base publish plugin
-        base_settings = super(MayaUnrealTurntablePublishPlugin, self).settings or {}
-
-        # settings specific to this class
-        settings = {
-            "Publish Template": {
-                "type": "template",
-                "default": None,
-                "description": "Template path for published work files. Should"
-                               "correspond to a template defined in "
-                               "templates.yml.",
-            },
-            "Work Template": {
-                "type": "template",
-                "default": None,
-                "description": "Template path for exported FBX files. Should"
-                               "correspond to a template defined in "
-                               "templates.yml.",
-            },
-            "Unreal Engine Version": {
-                "type": "string",
-                "default": "4.26",
-                "description": "Version of the Unreal Engine executable to use."
-            },
-            "Unreal Engine Path": {
-                "type": "string",
-                "default": None,
-                "description": "Full path the Unreal Engine executable to use."
-            },
-            # TODO: check if this should actually be a TK template.
-            "Unreal Project Path Template": {
-                "type": "string",
-                "default": "{config}/tk-multi-publish2/tk-maya/unreal/resources/{unreal_engine_version}/turntable/turntable.uproject",
-                "description": "Path template to the Unreal project to load."
-                               "{config}, {engine}, {unreal_engine_version} keys "
-                               "can be used and are replaced with runtime values."
-            },
-            "Unreal Project Path": {
-                "type": "string",
-                "default": None,
-                "description": "Path to the Unreal project to load."
-            },
-            "Turntable Map Path": {
-                "type": "string",
-                "default": "/Game/turntable/level/turntable.umap",
-                "description": "Unreal path to the turntable map to use to render the turntable."
-            },
-            "Sequence Path": {
-                "type": "string",
-                "default": "/Game/turntable/sequence/turntable_sequence.turntable_sequence",
-                "description": "Unreal path to the level sequence to use to render the turntable."
-            },
-            "Turntable Assets Path": {
-                "type": "string",
-                "default": "/Game/maya_turntable_assets",
-                "description": "Unreal output path where the turntable assets will be imported."
-            },
-        }
-
-        # Update the base settings with our settings
-        base_settings.update(settings)
-        return base_settings
+        The settings are only built once and cached.
+        """
+        if self._settings_cache is None:
+            # inherit the settings from the base publish plugin
+            base_settings = super(MayaUnrealTurntablePublishPlugin, self).settings or {}
+            # Update the base settings with our settings, copying them so the
+            # class definitions can't be changed.
+            base_settings.update(
+                (name, dict(setting)) for name, setting in self._turntable_settings.items()
+            )
+            self._settings_cache = base_settings
+        return self._settings_cache
 
     @property
     def item_filters(self):
@@ -540,15 +747,16 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         self.logger.info("Getting settings from UI")
         # Please note that we don't have to return all settings here, just the
         # settings which are editable in the UI.
+        # Qt returns str values with Python 3, no conversion is needed.
         settings = {
-            "Unreal Engine Version": six.ensure_str(widget.unreal_setup_widget.unreal_version),
-            "Unreal Engine Path": six.ensure_str(widget.unreal_setup_widget.unreal_path),
+            "Unreal Engine Version": widget.unreal_setup_widget.unreal_version,
+            "Unreal Engine Path": widget.unreal_setup_widget.unreal_path,
             # Get the project path evaluated from the template or the value which
             # was manually set.
-            "Unreal Project Path": six.ensure_str(widget.unreal_setup_widget.unreal_project_path),
-            "Turntable Map Path": six.ensure_str(widget.unreal_turntable_map_widget.text()),
-            "Sequence Path": six.ensure_str(widget.unreal_sequence_widget.text()),
-            "Turntable Assets Path": six.ensure_str(widget.unreal_turntable_asset_widget.text()),
+            "Unreal Project Path": widget.unreal_setup_widget.unreal_project_path,
+            "Turntable Map Path": widget.unreal_turntable_map_widget.text(),
+            "Sequence Path": widget.unreal_sequence_widget.text(),
+            "Turntable Assets Path": widget.unreal_turntable_asset_widget.text(),
             # "HDR Path": widget.hdr_image_template_widget.get_path(),
             # "Start Frame": widget.start_frame_spin_box.value(),
             # "End Frame": widget.end_frame_spin_box.value(),
@@ -581,7 +789,7 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         )
 
         try:
-            unreal_versions = self.get_unreal_versions()
+            unreal_versions = self._get_cached_unreal_versions()
             widget.unreal_setup_widget.populate_unreal_versions(
                 unreal_versions,
                 cur_settings["Unreal Engine Version"],
@@ -595,6 +803,39 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         widget.unreal_sequence_widget.setText(cur_settings["Sequence Path"])
         widget.unreal_turntable_asset_widget.setText(cur_settings["Turntable Assets Path"])
 
+    def _get_settings_manager(self):
+        """
+        Return a user settings manager to save and load settings.
+
+        The manager is instantiated on first access and then cached.
+
+        :returns: A SG utils framework :class:`UserSettings` instance.
+        """
+        if self._settings_manager is None:
+            # Retrieve SG utils framework settings module and instantiate a manager
+            fw = self.load_framework("tk-framework-shotgunutils_v5.x.x")
+            module = fw.import_module("settings")
+            self._settings_manager = module.UserSettings(self.parent)
+        return self._settings_manager
+
+    @property
+    def _engine(self):
+        """
+        The current engine, retrieved on first access and then cached.
+        """
+        if self._engine_cache is None:
+            self._engine_cache = sgtk.platform.current_engine()
+        return self._engine_cache
+
+    @property
+    def _unrealqt_fw(self):
+        """
+        The Unreal Qt framework, loaded on first access and then cached.
+        """
+        if self._unrealqt_fw_cache is None:
+            self._unrealqt_fw_cache = self.load_framework("tk-framework-unrealqt_v1.x.x")
+        return self._unrealqt_fw_cache
+
     def load_saved_ui_settings(self, settings):
         """
         Load saved settings and update the given settings dictionary with them.
@@ -602,10 +843,7 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         :param settings: A dictionary where keys are settings names and
                          values Settings instances.
         """
-        # Retrieve SG utils framework settings module and instantiate a manager
-        fw = self.load_framework("tk-framework-shotgunutils_v5.x.x")
-        module = fw.import_module("settings")
-        settings_manager = module.UserSettings(self.parent)
+        settings_manager = self._get_settings_manager()
 
         # Retrieve saved settings
         for name, saved_name in self._save_settings:
@@ -622,10 +860,7 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
 
         :param settings: A dictionary of Settings instances.
         """
-        # Retrieve SG utils framework settings module and instantiate a manager
-        fw = self.load_framework("tk-framework-shotgunutils_v5.x.x")
-        module = fw.import_module("settings")
-        settings_manager = module.UserSettings(self.parent)
+        settings_manager = self._get_settings_manager()
 
         # Save settings
         for name, saved_name in self._save_settings:
@@ -704,6 +939,8 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         :returns: ``True`` if item is valid, ``False`` otherwise.
         :raises ValueError: For problems which can't be solved in the current session.
         """
+        import maya.cmds as cmds
+        import maya.mel as mel
 
         path = _session_path()
 
@@ -719,18 +956,38 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
             )
             return False
 
-        # Get the normalized path
-        path = sgtk.util.ShotgunPath.normalize(path)
+        # get the configured work file template
+        work_template = item.properties.get("work_template")
+
+        # Values computed from the session path are kept on the item so they
+        # don't have to be computed again if the item is validated multiple
+        # times for the same session path and work template.
+        validated_session = item.local_properties.get("validated_session")
+        if (
+            not validated_session
+            or validated_session["session_path"] != path
+            or validated_session["work_template"] != work_template
+        ):
+            validated_session = {
+                "session_path": path,
+                "work_template": work_template,
+                # Get the normalized path
+                "path": sgtk.util.ShotgunPath.normalize(path),
+                "work_fields": None,
+            }
+            item.local_properties["validated_session"] = validated_session
+        path = validated_session["path"]
         # Store it in properties
         item.properties["path"] = path
 
-        # get the configured work file template
-        work_template = item.properties.get("work_template")
         publish_template = item.local_properties.get("publish_template")
         if work_template and publish_template:
             # get the current scene path and extract fields from it using the work
             # template:
-            work_fields = work_template.get_fields(path)
+            if validated_session["work_fields"] is None:
+                validated_session["work_fields"] = work_template.get_fields(path)
+            # Copy the fields since additional keys are added below.
+            work_fields = dict(validated_session["work_fields"])
 
             # Add additional keys needed by the template
             if sys.platform == "win32":
@@ -803,25 +1060,12 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         self.get_unreal_project_property(settings, item)
 
         # Validate the Unreal data settings, stash in properties
-        turntable_map_path = settings["Turntable Map Path"].value
-        if not turntable_map_path:
-            self.logger.debug("No Unreal turntable map configured.")
-            return False
-        item.properties["turntable_map_path"] = turntable_map_path
-
-        # Validate the Unreal level sequence path, stash in properties
-        sequence_path = settings["Sequence Path"].value
-        if not sequence_path:
-            self.logger.debug("No Unreal turntable sequence configured.")
-            return False
-        item.properties["sequence_path"] = sequence_path
-
-        # Validate the Unreal turntable assets path, stash in properties
-        turntable_assets_path = settings["Turntable Assets Path"].value
-        if not turntable_assets_path:
-            self.logger.debug("No Unreal turntable assets path configured.")
-            return False
-        item.properties["turntable_assets_path"] = turntable_assets_path
+        for name, property_name, error_msg in self._required_settings:
+            value = settings[name].value
+            if not value:
+                self.logger.debug(error_msg)
+                return False
+            item.properties[property_name] = value
 
         self.save_ui_settings(settings)
         return True
@@ -851,22 +1095,20 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
             # The path was not explicitely set, either from settings or the UI,
             # compute one from detected Unreal versions and the default version
             # Collect Unreal versions
-            unreal_versions = self.get_unreal_versions()
+            unreal_versions = self._get_cached_unreal_versions()
             if not unreal_versions:
                 raise RuntimeError(
                     "No Unreal version could be detected on this machine, please "
                     "set explicitely a value in this item's UI."
                 )
-            unreal_exec_path = None
-
-            for unreal_version in unreal_versions:
-                short_version = _short_version(unreal_version.version)
-                if short_version == short_engine_version:
-                    self.logger.info(
-                        "Found matching Unreal version %s for %s" % (unreal_version, short_engine_version)
-                    )
-                    unreal_exec_path = unreal_version.path
-                    break
+            unreal_version = self._unreal_versions_by_short_version.get(
+                short_engine_version
+            )
+            if unreal_version:
+                self.logger.info(
+                    "Found matching Unreal version %s for %s" % (unreal_version, short_engine_version)
+                )
+                unreal_exec_path = unreal_version.path
             else:
                 # Pick the first entry
                 self.logger.info(
@@ -875,7 +1117,7 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
                 unreal_exec_path = unreal_versions[0].path
                 unreal_engine_version = unreal_versions[0].version
 
-        if not unreal_exec_path or not os.path.exists(unreal_exec_path):
+        if not unreal_exec_path or not _cached_path_check(os.path.exists, unreal_exec_path):
             raise RuntimeError(
                 "Unreal executable not found at %s" % unreal_exec_path
             )
@@ -913,7 +1155,7 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
                     item.properties["unreal_engine_version"],
                 )
             )
-        if not os.path.isfile(unreal_project_path):
+        if not _cached_path_check(os.path.isfile, unreal_project_path):
             raise RuntimeError(
                 "Unreal project not found at %s" % unreal_project_path
             )
@@ -930,24 +1172,8 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
             return published_file["path"]["local_path"]
 
         if "url" in published_file["path"]:
-            url = published_file["path"]["url"]
-            parsed = parse.urlparse(url)
-            if parsed.scheme == "file":
-                # Copied from
-                # https://github.com/shotgunsoftware/tk-core/blob/2fc8287a19f8f002e23101836bafba0ec0de9dc9/python/tank/util/shotgun/publish_resolve.py#L311
-                if parsed.netloc:
-                    # UNC path
-                    path = parse.unquote(
-                        "//%s%s" % (parsed.netloc, parsed.path)
-                    )
-                else:
-                    path = parse.unquote(parsed.path)
-                    # Deal with bad paths being set
-                    # file:///C:/Users/me/default/data/publishes/Trooper_Full_NoKnife_2.fbx
-                    # Leading to /C:/Users/me/default/data/publishes/Trooper_Full_NoKnife_2.fbx
-                    # as path.
-                    if re.match("^/[A-Za-z]:/", path):
-                        path = path[1:]
+            path = _local_path_from_url(published_file["path"]["url"])
+            if path is not None:
                 return path
 
         raise ValueError("Unable to get a local path from %s" % published_file)
@@ -961,6 +1187,10 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
             instances.
         :param item: Item to process
         """
+        import concurrent.futures
+        import datetime
+        import pprint
+        import tempfile
 
         # Get the Unreal settings again
         unreal_exec_path = item.properties["unreal_exec_path"]
@@ -970,97 +1200,133 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         turntable_assets_path = item.properties["turntable_assets_path"]
         publish_path = self.get_publish_path(settings, item)
         publish_path = os.path.normpath(publish_path)
+        # Split the destination path into folder and filename once
+        destination_folder, publish_name = os.path.split(publish_path)
+        movie_name = os.path.splitext(publish_name)[0]
 
         # This plugin publishes a turntable movie to Shotgun
         # These are the steps needed to do that
 
-        # =======================
-        # 1. Export the Maya scene to FBX
-        # The FBX will be exported to a temp folder
-        # Another folder can be specified as long as the name has no spaces
-        # Spaces are not allowed in command line Unreal Python args
-        temp2_folder = tempfile.mkdtemp(suffix="temp_unreal_shotgun")
+        # Temp folders are created in the user temp folder. On Windows, the
+        # default temp folder can be returned with short 8.3 names, which
+        # Unreal doesn't handle well, so the long path is used instead.
+        if sys.platform == "win32" and os.getenv("LOCALAPPDATA"):
+            temp_parent = os.path.join(
+                os.path.expanduser(os.getenv("LOCALAPPDATA")),
+                "Temp",
+            )
+        else:
+            temp_parent = tempfile.gettempdir()
+
+        project_path, project_file = os.path.split(unreal_project_path)
+        project_copy = None
+        if settings["Copy Project To Temp"].value:
+            # Copy the Unreal project in a temp location so we can modify it
+            temp_dir = tempfile.mkdtemp(prefix="unreal_project_", dir=temp_parent)
+            self.logger.debug("The temp_dir is {}".format(temp_dir))
+            # Store the temp dir path on the item for cleanup in finalize
+            item.local_properties["temp_dir"] = temp_dir
+
+            project_folder = os.path.basename(project_path)
+            temp_project_dir = os.path.join(temp_dir, project_folder)
+            temp_project_path = os.path.join(temp_project_dir, project_file)
+            self.logger.debug("Copying %s to %s" % (unreal_project_path, temp_project_path))
+            # The copy is done in a background thread while the FBX is exported,
+            # which must be done from the main thread in Maya.
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            project_copy = executor.submit(
+                _clone_unreal_project,
+                project_path,
+                temp_project_dir,
+            )
+            # Release the executor thread as soon as the copy is done.
+            executor.shutdown(wait=False)
+        else:
+            # Use the Unreal project directly
+            self.logger.debug("Using Unreal project %s" % unreal_project_path)
+            temp_project_dir = project_path
+            temp_project_path = unreal_project_path
+
+        # The Unreal project copy must be waited for and removed if anything
+        # goes wrong before it is used, finalize is not called in that case.
+        project_ready = False
         try:
-            _tmp_folder_usr, _tmp_folder_app = temp2_folder.split('AppData')
-        except:
-            raise RuntimeError("The temp_unreal_shotgun doesn't contains appdata folder")
-
-        local_appdata_path = os.getenv('LOCALAPPDATA')
-        local_appdata_path = os.path.expanduser(local_appdata_path)
-        temp_folder = os.path.dirname(local_appdata_path) + _tmp_folder_app
-        # Store the temp folder path on the item for cleanup in finalize
-        item.local_properties["temp_folder"] = temp_folder
-        fbx_folder = temp_folder
-
-        # Get the filename from the work file
-        work_path = item.properties["path"]
-        work_path = os.path.normpath(work_path)
-        work_name = os.path.splitext(os.path.basename(work_path))[0]
-
-        # Replace non-word characters in filenames, Unreal doesn't like those
-        # Substitute '_' instead
-        exp = re.compile(r"\W", re.UNICODE)
-        work_name = exp.sub("_", work_name)
-
-        # Use current time as string as a unique identifier
-        now = datetime.datetime.now()
-        timestamp = str(now.hour) + str(now.minute) + str(now.second)
-
-        # Use the Fbx which was published by another item or save one now.
-        published_fbx = item.parent.properties.get("sg_fbx_publish_data")
-        if published_fbx:
-            fbx_published_path = self._get_local_path(published_fbx)
-            # Check the path: Unreal doesn't like non-word characters in filenames
-            self.logger.info("Using published FBX file %s" % fbx_published_path)
-            if re.search(exp, os.path.splitext(fbx_published_path)[0]):
-                fbx_name = work_name + "_" + timestamp + "_turntable.fbx"
-                fbx_output_path = os.path.join(fbx_folder, fbx_name)
-                if not os.path.exists(fbx_output_path):
-                    self.logger.debug("The temp fbx output path {} doesn't exist. Will build the path".format(fbx_output_path))
-                    os.makedirs(os.path.dirname(fbx_output_path), exist_ok=True)
-                # Make a copy of the file
-                self.logger.debug(
-                    "Copying %s to %s" % (
-                        fbx_published_path,
-                        fbx_output_path,
+            # =======================
+            # 1. Export the Maya scene to FBX
+            # The FBX will be exported to a temp folder
+            # Another folder can be specified as long as the name has no spaces
+            # Spaces are not allowed in command line Unreal Python args
+            temp_folder = tempfile.mkdtemp(prefix="temp_unreal_shotgun_", dir=temp_parent)
+            # Store the temp folder path on the item for cleanup in finalize
+            item.local_properties["temp_folder"] = temp_folder
+            fbx_folder = temp_folder
+
+            # Get the filename from the work file
+            work_path = item.properties["path"]
+            work_path = os.path.normpath(work_path)
+            work_name = os.path.splitext(os.path.basename(work_path))[0]
+
+            # Replace non-word characters in filenames, Unreal doesn't like those
+            # Substitute '_' instead
+            work_name = _NON_WORD_RE.sub("_", work_name)
+
+            # Use current time as string as a unique identifier, zero padded and
+            # with microseconds so different times can't give the same string.
+            timestamp = datetime.datetime.now().strftime("%H%M%S%f")
+
+            # Use the Fbx which was published by another item or save one now.
+            published_fbx = item.parent.properties.get("sg_fbx_publish_data")
+            if published_fbx:
+                fbx_published_path = self._get_local_path(published_fbx)
+                # Check the path: Unreal doesn't like non-word characters in filenames
+                self.logger.info("Using published FBX file %s" % fbx_published_path)
+                if _NON_WORD_RE.search(os.path.splitext(fbx_published_path)[0]):
+                    fbx_name = "%s_%s_turntable.fbx" % (work_name, timestamp)
+                    fbx_output_path = os.path.join(fbx_folder, fbx_name)
+                    if not os.path.exists(fbx_output_path):
+                        self.logger.debug("The temp fbx output path {} doesn't exist. Will build the path".format(fbx_output_path))
+                        os.makedirs(os.path.dirname(fbx_output_path), exist_ok=True)
+                    # Link the file under the new name, or make a copy of it if
+                    # it can't be linked.
+                    self.logger.debug(
+                        "Linking or copying %s to %s" % (
+                            fbx_published_path,
+                            fbx_output_path,
+                        )
                     )
-                )
-                shutil.copy(fbx_published_path, fbx_output_path)
+                    _link_or_copy(fbx_published_path, fbx_output_path)
+                else:
+                    fbx_output_path = fbx_published_path
             else:
-                fbx_output_path = fbx_published_path
-        else:
-            # Replace file extension with .fbx and suffix it with "_turntable"
-            fbx_name = "%s_%s_turntable.fbx" % (work_name, timestamp)
-            fbx_output_path = os.path.join(fbx_folder, fbx_name)
+                # Replace file extension with .fbx and suffix it with "_turntable"
+                fbx_name = "%s_%s_turntable.fbx" % (work_name, timestamp)
+                fbx_output_path = os.path.join(fbx_folder, fbx_name)
 
-            # Export the FBX to the given output path
-            if not self._maya_export_fbx(fbx_output_path):
-                return False
+                # Export the FBX to the given output path
+                if not self._maya_export_fbx(fbx_output_path):
+                    return False
+
+                # Keep the fbx path for cleanup at finalize
+                item.properties["temp_fbx_path"] = fbx_output_path
+
+            # Wait for the Unreal project copy to be done, this raises any error
+            # which happened during the copy.
+            if project_copy:
+                project_copy.result()
+            project_ready = True
+        finally:
+            if project_copy and not project_ready:
+                # Copy errors are ignored here so they don't hide the actual
+                # failure.
+                concurrent.futures.wait([project_copy])
+                del item.local_properties["temp_dir"]
+                _remove_tree_in_background(temp_dir)
 
-            # Keep the fbx path for cleanup at finalize
-            item.properties["temp_fbx_path"] = fbx_output_path
         # =======================
         # 2. Import the FBX into Unreal.
         # 3. Instantiate the imported asset into a duplicate of the turntable map.
         # Use the unreal_setup_turntable to do this in Unreal
         self.logger.info("Setting up Unreal turntable project...")
-        # Copy the Unreal project in a temp location so we can modify it
-        temp_dir2 = tempfile.mkdtemp()
-        try:
-            _tmp_dir_usr, _tmp_app = temp_dir2.split('AppData')
-        except:
-            raise RuntimeError("It doesn't return path in appdata")
-        temp_dir = os.path.dirname(local_appdata_path) + _tmp_app
-        self.logger.debug("The temp_dir is {}".format(temp_dir))
-        # Store the temp dir path on the item for cleanup in finalize
-        item.local_properties["temp_dir"] = temp_dir
-
-        project_path, project_file = os.path.split(unreal_project_path)
-        project_folder = os.path.basename(project_path)
-        temp_project_dir = os.path.join(temp_dir, project_folder)
-        temp_project_path = os.path.join(temp_project_dir, project_file)
-        self.logger.debug("Copying %s to %s" % (unreal_project_path, temp_project_path))
-        shutil.copytree(project_path, temp_project_dir)
 
         current_folder = os.path.dirname(__file__)
         script_path = os.path.abspath(
@@ -1074,9 +1340,10 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
 
         # Workaround for script path with spaces in it
         if " " in script_path:
-            # Make temporary copies of the scripts to a path without spaces
-            script_destination = os.path.join(self.temp_folder, "unreal_setup_turntable.py")
-            shutil.copy(script_path, script_destination)
+            # Make temporary links or copies of the scripts to a path without
+            # spaces
+            script_destination = os.path.join(temp_folder, "unreal_setup_turntable.py")
+            _link_or_copy_script(script_path, script_destination)
             script_path = script_destination
 
             importer_path = os.path.abspath(
@@ -1087,30 +1354,25 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
                     "unreal_importer.py",
                 )
             )
-            importer_destination = os.path.join(self.temp_folder, "unreal_importer.py")
-            shutil.copy(importer_path, importer_destination)
+            importer_destination = os.path.join(temp_folder, "unreal_importer.py")
+            _link_or_copy_script(importer_path, importer_destination)
         # UE5 does some weird things with \ so let's replace them with /
         script_path = script_path.replace("\\", "/")
 
-        if " " in temp_project_path:
-            temp_project_path = '"{}"'.format(temp_project_path)
-
         # Set the script arguments in the environment variables since we don't
         # have ways to run the Editor with a Python script and pass its arguments
         # on the command line.
-        run_env = copy.copy(os.environ)
+        run_env = os.environ.copy()
         # Environment variables for turntable script
-        # Make sure they are strings and not unicode with py2, otherwise
-        # "environment can only contain strings" erors will happen.
         extra_env = {
             # The FBX to import into Unreal
-            "UNREAL_SG_FBX_OUTPUT_PATH": six.ensure_str(fbx_output_path),
+            "UNREAL_SG_FBX_OUTPUT_PATH": fbx_output_path,
             # The Unreal content browser folder where the asset will be imported into
-            "UNREAL_SG_ASSETS_PATH": six.ensure_str(turntable_assets_path),
+            "UNREAL_SG_ASSETS_PATH": turntable_assets_path,
             # The Unreal turntable map to duplicate where the asset will be instantiated into
-            "UNREAL_SG_MAP_PATH": six.ensure_str(turntable_map_path),
-            "UNREAL_SG_SEQUENCE_PATH": six.ensure_str(sequence_path),
-            "UNREAL_SG_MOVIE_OUTPUT_PATH": six.ensure_str(publish_path),
+            "UNREAL_SG_MAP_PATH": turntable_map_path,
+            "UNREAL_SG_SEQUENCE_PATH": sequence_path,
+            "UNREAL_SG_MOVIE_OUTPUT_PATH": publish_path,
         }
         self.logger.info("Adding %s to the environment" % extra_env)
         run_env.update(extra_env)
@@ -1124,11 +1386,6 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         # =======================
         # 4. Render the turntable to movie.
 
-        # Split the destination path into folder and filename
-        destination_folder = os.path.split(publish_path)[0]
-        movie_name = os.path.split(publish_path)[1]
-        movie_name = os.path.splitext(movie_name)[0]
-
         # Ensure that the destination path exists before rendering the sequence
         self.parent.ensure_folder_exists(destination_folder)
         self.logger.info("Rendering turntable to %s" % publish_path)
@@ -1148,7 +1405,7 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
             )
             # Workaround for Level Sequencer only rendering avi on Windows and Movie Queue rendering
             # mov on all platforms
-            publish_path = re.sub(r"\.avi$", ".mov", publish_path)
+            publish_path = _AVI_SUFFIX_RE.sub(".mov", publish_path)
             item.local_properties["publish_path"] = publish_path
             self._unreal_render_movie_with_movie_render_queue(
                 unreal_exec_path,
@@ -1233,11 +1490,7 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         # Stash the version info in the item just in case
         item.local_properties["sg_version_data"] = version
 
-        # Ensure the path is utf-8 encoded to avoid issues with
-        # the shotgun api
-        upload_path = six.ensure_text(
-            self._get_local_path(item.properties.sg_publish_data)
-        )
+        upload_path = self._get_local_path(item.properties.sg_publish_data)
 
         # Upload the file to SG
         self.logger.info("Uploading content...")
@@ -1259,7 +1512,6 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
             instances.
         :param item: Item to process
         """
-
         # The base implementation needs a property, not a local property
         item.properties.sg_publish_data = item.local_properties.sg_publish_data
         # do the base class finalization
@@ -1281,12 +1533,18 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
 
         # if self.logger.getEffectiveLevel() > logging.DEBUG:
 
-        if temp_folder:
+        # Removing the temp folders can take a while with the Unreal project
+        # copy, so it is done in the background to not block the publisher.
+        if temp_folder and os.path.isdir(temp_folder):
             self.logger.debug("Removing temp_folder %s" % temp_folder)
-            shutil.rmtree(temp_folder)
-        if temp_dir:
+            _remove_tree_in_background(temp_folder)
+        if temp_dir and os.path.isdir(temp_dir):
             self.logger.debug("Removing temp_dir %s" % temp_dir)
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            _remove_tree_in_background(temp_dir)
+        # Don't let cached path checks and Unreal versions outlive the publish
+        # session.
+        _found_paths.clear()
+        self.invalidate_unreal_versions_cache()
         # Revive this when Unreal supports spaces in command line Python args
         # fbx_path = item.properties.get("temp_fbx_path")
         # if fbx_path:
@@ -1307,6 +1565,8 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
             return None
 
     def _maya_export_fbx(self, fbx_output_path):
+        import maya.cmds as cmds
+
         # Export scene to FBX
         try:
             self.logger.info("Exporting scene to FBX {}".format(fbx_output_path))
@@ -1332,21 +1592,18 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         :param str env: Optional dictionary with the environment variables to set
                         in the subprocess. If not set, the current environment
                         variables are used.
+        :returns: The Unreal process exit code.
         """
         command_args = self._get_unreal_base_command(
             unreal_exec_path,
             unreal_project_path,
-        )
-        command_args.append(
-            '-ExecutePythonScript="{}"'.format(script_path)  # Script to run in Unreal
+        ) + (
+            "-ExecutePythonScript={}".format(script_path),  # Script to run in Unreal
         )
         self.logger.info(
             "Executing script in Unreal with arguments: {}".format(command_args)
         )
-        subprocess.call(
-            command_args,
-            env=env,
-        )
+        return self._run_unreal_command(command_args, env=env)
 
     def _get_unreal_base_command(self, unreal_exec_path, unreal_project_path):
         """
@@ -1354,12 +1611,12 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
 
         :param str unreal_exec_path: Full path to Unreal executable.
         :param str unreal_project_path: Full path to the Unreal Project file to load.
-        :returns: A list of command line arguments.
+        :returns: A tuple of command line arguments.
         """
         if sys.platform == "darwin" and os.path.splitext(unreal_exec_path)[1] == ".app":
             # Special case for Osx if the Unreal.app was chosen instead of the
             # executable
-            cmdline_args = [
+            return (
                 "open",
                 "-W",
                 "-n",
@@ -1367,13 +1624,91 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
                 unreal_exec_path,  # Unreal executable path
                 "--args",
                 unreal_project_path,  # Unreal project
-            ]
-        else:
-            cmdline_args = [
-                unreal_exec_path,  # Unreal executable path
-                unreal_project_path,  # Unreal project
-            ]
-        return cmdline_args
+            )
+        return (
+            unreal_exec_path,  # Unreal executable path
+            unreal_project_path,  # Unreal project
+        )
+
+    def _run_unreal_command(self, cmdline_args, env=None):
+        """
+        Run Unreal in a subprocess with the given command line arguments.
+
+        Unreal output is captured and logged as it is produced, lines received
+        together are logged in a single record.
+        Qt events are processed while waiting for Unreal, so the application
+        UI stays responsive.
+
+        Only Unreal itself is waited for: processes it started and which are
+        still running when it exits are not.
+
+        :param cmdline_args: A list or tuple of command line arguments.
+        :param str env: Optional dictionary with the environment variables to set
+                        in the subprocess. If not set, the current environment
+                        variables are used.
+        :returns: The Unreal process exit code.
+        """
+        import queue
+        import subprocess
+        import threading
+
+        process = subprocess.Popen(
+            cmdline_args,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        # Unreal output is read from a background thread, reading it from the
+        # main thread would block until a line is available.
+        lines = queue.Queue()
+
+        def read_output():
+            try:
+                for line in iter(process.stdout.readline, b""):
+                    lines.put(line)
+            finally:
+                process.stdout.close()
+                # Tell the main thread there is nothing more to read.
+                lines.put(None)
+
+        reader = threading.Thread(target=read_output, daemon=True)
+        reader.start()
+        app = QtCore.QCoreApplication.instance()
+        drain_deadline = None
+        done = False
+        while not done:
+            batch = []
+            try:
+                line = lines.get(timeout=_UNREAL_POLL_INTERVAL)
+                # Collect all the lines already available without waiting.
+                while line is not None:
+                    batch.append(line)
+                    line = lines.get_nowait()
+                done = True
+            except queue.Empty:
+                pass
+            if batch:
+                # Unreal output encoding is not known for sure, decode as
+                # utf-8 and replace invalid characters.
+                self.logger.debug(
+                    "Unreal: %s" % b"".join(batch).decode("utf-8", "replace").rstrip()
+                )
+            if not done and process.poll() is not None:
+                # Unreal exited but the pipe can be kept open by processes it
+                # started: stop as soon as no more output is available, or
+                # after a short while.
+                if drain_deadline is None:
+                    drain_deadline = time.monotonic() + _UNREAL_OUTPUT_DRAIN_TIMEOUT
+                if not batch or time.monotonic() > drain_deadline:
+                    break
+            if app:
+                app.processEvents()
+        # The reader thread is not joined, it could be blocked until processes
+        # started by Unreal exit, it is a daemon thread which ends by itself.
+        exit_code = process.wait()
+        if exit_code:
+            self.logger.warning("Unreal exited with code %s" % exit_code)
+        return exit_code
 
     def _unreal_render_movie_with_sequencer(
         self,
@@ -1407,19 +1742,18 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
                 return False, None
 
         # Render the sequence to a movie file using the following command-line arguments
-        cmdline_args = self._get_unreal_base_command(
-            unreal_exec_path,
-            unreal_project_path,
-        )
-
-        # Note that any command-line arguments (usually paths) that could contain spaces must be enclosed between quotes
+        # Arguments are passed as separate entries to the subprocess, which
+        # handles quoting values with spaces: they must not be quoted here.
 
         # Command-line arguments for Sequencer Render to Movie
         # See: https://docs.unrealengine.com/en-us/Engine/Sequencer/Workflow/RenderingCmdLine
-        cmdline_args.extend([
+        cmdline_args = self._get_unreal_base_command(
+            unreal_exec_path,
+            unreal_project_path,
+        ) + (
             unreal_map_path,  # Level to load for rendering the sequence
             "-LevelSequence={}".format(sequence_path),  # The sequence to render
-            '-MovieFolder="{}"'.format(output_folder),  # Output folder, must match the work template
+            "-MovieFolder={}".format(output_folder),  # Output folder, must match the work template
             "-MovieName={}".format(movie_name),  # Output filename
             "-game",
             "-MovieSceneCaptureType=/Script/MovieSceneCapture.AutomatedLevelSequenceCapture",
@@ -1435,11 +1769,15 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
             "-NoTextureStreaming",
             "-NoLoadingScreen",
             "-NoScreenMessages",
-        ])
+        )
         self.logger.info("Sequencer command-line arguments: {}".format(cmdline_args))
 
         # TODO: fix command line arguments which contain space.
-        subprocess.call(cmdline_args)
+        exit_code = self._run_unreal_command(cmdline_args)
+        if exit_code:
+            # No need to check for the movie file, the render failed.
+            self.logger.error("Unreal Sequencer render failed with exit code %s" % exit_code)
+            return False, output_path
 
         return os.path.isfile(output_path), output_path
 
@@ -1463,57 +1801,22 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         """
         output_folder, output_file = os.path.split(output_path)
 
-        cmdline_args = self._get_unreal_base_command(
-            unreal_exec_path,
-            unreal_project_path,
-        )
-
         # Command line parameters were retrieved by submitting a queue in Unreal Editor with
         # a MoviePipelineNewProcessExecutor executor.
         # https://docs.unrealengine.com/4.27/en-US/PythonAPI/class/MoviePipelineNewProcessExecutor.html?highlight=executor
-        cmdline_args.extend([
-            "MoviePipelineEntryMap?game=/Script/MovieRenderPipelineCore.MoviePipelineGameMode",
-            "-game",
-            "-Multiprocess",
-            "-NoLoadingScreen",
-            "-FixedSeed",
-            "-log",
-            "-Unattended",
-            "-messaging",
-            "-SessionName=\"Maya Turntable Movie Render\"",
-            "-nohmd",
-            "-windowed",
-            "-ResX=1280",
-            "-ResY=720",
-            # TODO: check what these settings are
-            "-dpcvars=%s" % ",".join([
-                "sg.ViewDistanceQuality=4",
-                "sg.AntiAliasingQuality=4",
-                "sg.ShadowQuality=4",
-                "sg.PostProcessQuality=4",
-                "sg.TextureQuality=4",
-                "sg.EffectsQuality=4",
-                "sg.FoliageQuality=4",
-                "sg.ShadingQuality=4",
-                "r.TextureStreaming=0",
-                "r.ForceLOD=0",
-                "r.SkeletalMeshLODBias=-10",
-                "r.ParticleLODBias=-10",
-                "foliage.DitheredLOD=0",
-                "foliage.ForceLOD=0",
-                "r.Shadow.DistanceScale=10",
-                "r.ShadowQuality=5",
-                "r.Shadow.RadiusThreshold=0.001000",
-                "r.ViewDistanceScale=50",
-                "r.D3D12.GPUTimeout=0",
-                "a.URO.Enable=0",
-            ]),
-            "-execcmds=r.HLOD 0",
+        cmdline_args = self._get_unreal_base_command(
+            unreal_exec_path,
+            unreal_project_path,
+        ) + _MRQ_STATIC_ARGS + (
             # This need to be a path relative the to the Unreal project "Saved" folder.
-            "-MoviePipelineConfig=\"%s\"" % manifest_path,
-        ])
+            "-MoviePipelineConfig=%s" % manifest_path,
+        )
         self.logger.info("Running %s" % cmdline_args)
-        subprocess.call(cmdline_args)
+        exit_code = self._run_unreal_command(cmdline_args)
+        if exit_code:
+            # No need to check for the movie file, the render failed.
+            self.logger.error("Unreal Movie Render Queue render failed with exit code %s" % exit_code)
+            return False, output_path
         return os.path.isfile(output_path), output_path
 
     def get_unreal_versions(self):
@@ -1530,7 +1833,7 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         # Since we only care about Unreal paths, we use the current project
         # context to retrieve the paths. Otherwise it would require having a valid
         # tk-unreal context matching the current one.
-        engine = sgtk.platform.current_engine()
+        engine = self._engine
         project_context = engine.sgtk.context_from_entity_dictionary(
             engine.context.project
         )
@@ -1543,32 +1846,44 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
 
         # Discover which versions of Unreal are available
         software_versions = software_launcher.scan_software()
-        versions = []
-        dev_versions = []
-        for software_version in software_versions:
-            # Insert non-dev builds at the start of the list
-            if "(Dev Build)" not in software_version.display_name:
-                versions.append(software_version)
-            else:
-                dev_versions.append(software_version)
-        fake_versions = []
-# Can be uncommented to fake multiple SW versions if needed.
-#        fake_versions = [
-#            SoftwareVersion(
-#                "Faked 5",
-#                "Faked",
-#                "faked"
-#            ),
-#            SoftwareVersion(
-#                "Faked 6",
-#                "Faked",
-#                "faked"
-#            )
-#
-#        ]
-        return fake_versions + versions + dev_versions
+        # Put non-dev builds at the start of the list, sorting is stable so
+        # the scan order is otherwise preserved.
+        return sorted(
+            software_versions,
+            key=lambda v: "(Dev Build)" in v.display_name,
+        )
 
-        return None
+    def invalidate_unreal_versions_cache(self):
+        """
+        Discard cached Unreal versions, they will be detected again on next
+        access.
+        """
+        self._unreal_versions_cache = None
+        self._unreal_versions_cache_time = None
+        self._unreal_versions_by_short_version = {}
+
+    def _get_cached_unreal_versions(self):
+        """
+        Return the list of known Unreal versions installed locally, detecting
+        them only if they were not retrieved in the last few seconds.
+
+        :returns: A list of TK software versions.
+        """
+        now = time.monotonic()
+        if (
+            self._unreal_versions_cache is None
+            or now - self._unreal_versions_cache_time > _UNREAL_VERSIONS_CACHE_TTL
+        ):
+            self._unreal_versions_cache = self.get_unreal_versions()
+            self._unreal_versions_cache_time = now
+            # Map short major.minor versions to the first matching version.
+            self._unreal_versions_by_short_version = {}
+            for unreal_version in self._unreal_versions_cache or []:
+                self._unreal_versions_by_short_version.setdefault(
+                    _short_version(unreal_version.version),
+                    unreal_version,
+                )
+        return self._unreal_versions_cache
 
     def evaluate_unreal_project_path(self, unreal_project_path_template, unreal_engine_version):
         """
@@ -1593,27 +1908,39 @@ class MayaUnrealTurntablePublishPlugin(HookBaseClass):
         if not unreal_engine_version:
             return None
         # Only keep major.minor from the Unreal version
-        short_version = ".".join(unreal_engine_version.split(".")[:2])
+        short_version = _short_version(unreal_engine_version)
         # Evaluate the "template"
-        engine = sgtk.platform.current_engine()
-        hooks_folder = engine.sgtk.pipeline_configuration.get_hooks_location()
-        fw = self.load_framework("tk-framework-unrealqt_v1.x.x")
+        values = dict(
+            self._get_project_path_values(),
+            unreal_engine_version=short_version,
+        )
+        # Replace all keys in a single pass, other braces are left untouched.
         return os.path.normpath(
-            unreal_project_path_template.replace(
-                "{config}",
-                os.path.dirname(hooks_folder),  # removed the hooks folder at the end
-            ).replace(
-                "{engine}",
-                engine.disk_location
-            ).replace(
-                "{unreal_engine_version}",
-                short_version
-            ).replace(
-                "{self}",
-                fw.disk_location
+            _PROJECT_PATH_KEY_RE.sub(
+                lambda match: values[match.group(1)],
+                unreal_project_path_template,
             )
         )
 
+    def _get_project_path_values(self):
+        """
+        Return the values used for Unreal project path template keys which
+        don't depend on the Unreal version.
+
+        The values are retrieved on first access and then cached.
+
+        :returns: A dictionary where keys are template keys and values are paths.
+        """
+        if self._project_path_values is None:
+            engine = self._engine
+            hooks_folder = engine.sgtk.pipeline_configuration.get_hooks_location()
+            self._project_path_values = {
+                "config": os.path.dirname(hooks_folder),  # removed the hooks folder at the end
+                "engine": engine.disk_location,
+                "self": self._unrealqt_fw.disk_location,
+            }
+        return self._project_path_values
+
     def _copy_work_to_publish(self, settings, item):
         """
         Override base implementation to do nothing.
@@ -1629,10 +1956,214 @@ def _short_version(version):
     :param str version: A version, as string, e.g. 5.0.2.
     :returns: A string.
     """
-    parts = version.split(".", 2)
-    if len(parts) > 2:
-         return ".".join(parts[:2])
-    return version
+    if not version:
+        return version
+    major, sep, rest = version.partition(".")
+    if not sep:
+        return version
+    minor, sep, _ = rest.partition(".")
+    if not sep:
+        return version
+    return "%s.%s" % (major, minor)
+
+
+def _get_qt_icon(resource_path):
+    """
+    Return a shared QIcon for the given Qt resource path.
+
+    :param str resource_path: A Qt resource path, e.g. ":/tk_multi_publish2/file.png".
+    :returns: A :class:`QtGui.QIcon` instance.
+    """
+    icon = _QT_ICONS.get(resource_path)
+    if icon is None:
+        icon = QtGui.QIcon()
+        icon.addPixmap(
+            QtGui.QPixmap(resource_path),
+            QtGui.QIcon.Normal,
+            QtGui.QIcon.Off
+        )
+        _QT_ICONS[resource_path] = icon
+    return icon
+
+
+@functools.lru_cache(maxsize=128)
+def _templates_from_path(tk, path):
+    """
+    Return the names of the templates matching the given path.
+
+    Results are cached, the Toolkit API instance is part of the cache key.
+
+    :param tk: A Toolkit API instance.
+    :param str path: A path to match.
+    :returns: A tuple of template names.
+    """
+    return tuple(template.name for template in tk.templates_from_path(path))
+
+
+@functools.lru_cache(maxsize=128)
+def _paths_from_template(tk, template_name, fields):
+    """
+    Return the paths existing on disk for the given template and fields.
+
+    Results are cached, the Toolkit API instance is part of the cache key.
+
+    :param tk: A Toolkit API instance.
+    :param str template_name: A template name.
+    :param fields: A sorted tuple of template fields (key, value) pairs.
+    :returns: A tuple of paths.
+    """
+    return tuple(
+        tk.paths_from_template(tk.templates[template_name], dict(fields))
+    )
+
+
+def _cached_path_check(check, path):
+    """
+    Return the result of the given check function for the given path.
+
+    Only successful checks are cached, so a path which was not found, e.g.
+    because it was mistyped, is checked again next time.
+
+    :param check: A function to call with the path, e.g. :func:`os.path.isfile`.
+    :param str path: The path to check.
+    :returns: A boolean.
+    """
+    key = (check, path)
+    if key in _found_paths:
+        return True
+    if check(path):
+        _found_paths.add(key)
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=128)
+def _local_path_from_url(url):
+    """
+    Return the local path for the given file url.
+
+    :param str url: A url, e.g. from a published file path.
+    :returns: A local path or ``None`` if the url is not a file url.
+    """
+    from urllib import parse
+
+    parsed = parse.urlparse(url)
+    if parsed.scheme != "file":
+        return None
+    # Copied from
+    # https://github.com/shotgunsoftware/tk-core/blob/2fc8287a19f8f002e23101836bafba0ec0de9dc9/python/tank/util/shotgun/publish_resolve.py#L311
+    if parsed.netloc:
+        # UNC path
+        return parse.unquote(
+            "//%s%s" % (parsed.netloc, parsed.path)
+        )
+    path = parse.unquote(parsed.path)
+    # Deal with bad paths being set
+    # file:///C:/Users/me/default/data/publishes/Trooper_Full_NoKnife_2.fbx
+    # Leading to /C:/Users/me/default/data/publishes/Trooper_Full_NoKnife_2.fbx
+    # as path.
+    if _WIN_DRIVE_PREFIX_RE.match(path):
+        path = path[1:]
+    return path
+
+
+def _link_or_copy(src, dst):
+    """
+    Hard link the given file to the given destination, or copy it if it can't
+    be linked, e.g. if the destination is on another device.
+
+    :param str src: Full path to the file to link or copy.
+    :param str dst: Full path to the destination file.
+    :returns: The destination path.
+    """
+    import shutil
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _link_or_copy_script(src, dst):
+    """
+    Symbolic link the given script to the given destination on platforms where
+    it is available, hard link or copy it otherwise.
+
+    Symbolic links usually need extra privileges on Windows, while hard links
+    don't.
+
+    :param str src: Full path to the script to link or copy.
+    :param str dst: Full path to the destination file.
+    :returns: The destination path.
+    """
+    if sys.platform != "win32":
+        try:
+            os.symlink(src, dst)
+            return dst
+        except (OSError, NotImplementedError):
+            pass
+    return _link_or_copy(src, dst)
+
+
+def _clone_unreal_project(src, dst):
+    """
+    Clone the given Unreal project folder to the given destination.
+
+    Files in folders which are not modified in place, like Content, are hard
+    linked when possible to avoid copying their content, except maps which are
+    modified when setting up the turntable. Other files and folders are copied,
+    so the original project is never changed through a link. Folders Unreal
+    writes to, like Saved, are not cloned and are re-created by Unreal.
+
+    :param str src: Full path to the Unreal project folder to clone.
+    :param str dst: Full path to the destination folder, it must not exist.
+    """
+    import shutil
+
+    def link_function(src_file, dst_file):
+        if os.path.splitext(src_file)[1].lower() in _UNREAL_PROJECT_COPIED_EXTENSIONS:
+            return shutil.copy2(src_file, dst_file)
+        return _link_or_copy(src_file, dst_file)
+
+    os.makedirs(dst)
+    for entry in os.scandir(src):
+        dst_path = os.path.join(dst, entry.name)
+        if entry.is_dir():
+            if entry.name in _UNREAL_PROJECT_SKIPPED_FOLDERS:
+                continue
+            if entry.name in _UNREAL_PROJECT_LINKED_FOLDERS:
+                shutil.copytree(entry.path, dst_path, copy_function=link_function)
+            else:
+                shutil.copytree(entry.path, dst_path)
+        else:
+            shutil.copy2(entry.path, dst_path)
+
+
+def _remove_tree_in_background(path):
+    """
+    Remove the given folder and all its content from a background thread.
+
+    The folder is first renamed so it is immediately out of the way, even if
+    its removal is slow or is interrupted when the application exits.
+
+    :param str path: Full path to the folder to remove.
+    """
+    import shutil
+    import threading
+
+    pending_path = "%s.pending_delete" % path
+    try:
+        os.rename(path, pending_path)
+    except OSError:
+        # Files can be locked, e.g. on Windows, just remove what we can in place.
+        pending_path = path
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(pending_path,),
+        kwargs={"ignore_errors": True},
+        daemon=True,
+    ).start()
 
 
 def _session_path():
@@ -1640,23 +2171,24 @@ def _session_path():
     Return the path to the current session
     :return:
     """
+    import maya.cmds as cmds
+
     path = cmds.file(query=True, sn=True)
 
-    return six.ensure_text(path)
+    if isinstance(path, bytes):
+        path = path.decode("utf-8")
+    return path
 
 
 def _save_session(path):
     """
     Save the current session to the supplied path.
     """
+    import maya.cmds as cmds
 
     # Maya can choose the wrong file type so we should set it here
     # explicitly based on the extension
-    maya_file_type = None
-    if path.lower().endswith(".ma"):
-        maya_file_type = "mayaAscii"
-    elif path.lower().endswith(".mb"):
-        maya_file_type = "mayaBinary"
+    maya_file_type = _MAYA_EXT_TYPES.get(os.path.splitext(path)[1].lower())
 
     cmds.file(rename=path)
 
@@ -1671,9 +2203,17 @@ def _save_session(path):
 def _get_save_as_action():
     """
     Simple helper for returning a log action dict for saving the session
+
+    The action is built once for the current engine and then reused, it must
+    not be modified.
     """
+    global _save_as_action_cache
+    import maya.cmds as cmds
 
     engine = sgtk.platform.current_engine()
+    cached_engine, action = _save_as_action_cache
+    if action is not None and cached_engine is engine:
+        return action
 
     # default save callback
     callback = cmds.SaveScene
@@ -1684,10 +2224,12 @@ def _get_save_as_action():
         if hasattr(app, "show_file_save_dlg"):
             callback = app.show_file_save_dlg
 
-    return {
+    action = {
         "action_button": {
             "label": "Save As...",
             "tooltip": "Save the current session",
             "callback": callback
         }
     }
+    _save_as_action_cache = (engine, action)
+    return action